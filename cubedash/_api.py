@@ -5,7 +5,7 @@ from flask import Blueprint, abort, request
 from cubedash import _utils
 
 from . import _model
-from ._utils import as_geojson
+from ._utils import as_geojson, as_geojson_feature_collection
 from .summary import ItemSort
 
 _MAX_DATASET_RETURN = 2000
@@ -27,20 +27,15 @@ def datasets_geojson(
 
     time = _utils.as_time_range(year, month, day, tzinfo=_model.STORE.grouping_timezone)
 
-    return as_geojson(
-        dict(
-            type="FeatureCollection",
-            features=[
-                s.as_geojson()
-                for s in _model.STORE.search_items(
-                    product_names=[product_name],
-                    time=time,
-                    limit=limit,
-                    order=ItemSort.UNSORTED,
-                )
-                if s.geom_geojson is not None
-            ],
+    return as_geojson_feature_collection(
+        s.as_geojson()
+        for s in _model.STORE.search_items(
+            product_names=[product_name],
+            time=time,
+            limit=limit,
+            order=ItemSort.UNSORTED,
         )
+        if s.geom_geojson is not None
     )
 
     # TODO: replace this api with stac?
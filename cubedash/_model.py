@@ -1,7 +1,7 @@
 import os
 import time
 from pathlib import Path
-from typing import Counter, Dict, Iterable, Optional, Tuple
+from typing import Dict, Iterable, Mapping, Optional, Tuple
 
 import flask
 import flask_themes
@@ -70,6 +70,7 @@ def get_time_summary(
     return STORE.get(product_name, year, month, day)
 
 
+@cache.memoize(timeout=60)
 def get_product_summary(product_name: str) -> ProductSummary:
     return STORE.get_product_summary(product_name)
 
@@ -135,7 +136,7 @@ def get_regions_geojson(
     if not region_info:
         return None
 
-    product_summary = STORE.get_product_summary(product.name)
+    product_summary = get_product_summary(product.name)
     if not product_summary:
         # Valid product, but no summary generated.
         return None
@@ -179,7 +180,7 @@ def _get_footprint(period: TimePeriodOverview) -> Optional[MultiPolygon]:
 
 
 def _get_regions_geojson(
-    region_counts: Counter[str], region_info: RegionInfo
+    region_counts: Mapping[str, int], region_info: RegionInfo
 ) -> Optional[Dict]:
     if not region_info:
         # Regions are unsupported for product
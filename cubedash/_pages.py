@@ -361,7 +361,7 @@ def inject_globals():
     # The default is the currently-viewed product's summary refresh date.
     last_updated = None
     if "product_name" in flask.request.view_args:
-        product_summary = _model.STORE.get_product_summary(
+        product_summary = _model.get_product_summary(
             flask.request.view_args["product_name"]
         )
         if product_summary:
@@ -322,19 +322,8 @@ def as_rich_json(o):
 
 
 def as_json(o, content_type="application/json") -> flask.Response:
-    # Indent if they're loading directly in a browser.
-    #   (Flask's Accept parsing is too smart, and sees html-acceptance in
-    #    default ajax requests "accept: */*". So we do it raw.)
-    prefer_formatted = "text/html" in flask.request.headers.get("Accept", ())
-
     return flask.Response(
-        rapidjson.dumps(
-            o,
-            datetime_mode=rapidjson.DM_ISO8601,
-            uuid_mode=rapidjson.UM_CANONICAL,
-            number_mode=rapidjson.NM_NATIVE,
-            indent=4 if prefer_formatted else None,
-        ),
+        _to_json(o, indent=4 if _prefers_formatted() else None),
         content_type=content_type,
     )
 
@@ -343,6 +332,51 @@ def as_geojson(o):
     return as_json(o, content_type="application/geo+json")
 
 
+def as_geojson_feature_collection(features: Iterable[Dict]) -> flask.Response:
+    """
+    Stream a GeoJSON FeatureCollection, encoding each feature as it's produced.
+
+    (So large collections are never held in memory all at once)
+    """
+    indent = 4 if _prefers_formatted() else None
+
+    # Read the first feature before we respond, so that any error (such as from
+    # the query behind them) is raised as a normal error response, rather than
+    # breaking off an already-successful one.
+    features = iter(features)
+    first_feature = next(features, None)
+
+    def _encode():
+        yield '{"type": "FeatureCollection", "features": ['
+        if first_feature is not None:
+            yield _to_json(first_feature, indent=indent)
+            for feature in features:
+                yield "," + _to_json(feature, indent=indent)
+        yield "]}"
+
+    return flask.Response(
+        flask.stream_with_context(_encode()),
+        content_type="application/geo+json",
+    )
+
+
+def _prefers_formatted() -> bool:
+    # Indent if they're loading directly in a browser.
+    #   (Flask's Accept parsing is too smart, and sees html-acceptance in
+    #    default ajax requests "accept: */*". So we do it raw.)
+    return "text/html" in flask.request.headers.get("Accept", ())
+
+
+def _to_json(o, indent: Optional[int] = None) -> str:
+    return rapidjson.dumps(
+        o,
+        datetime_mode=rapidjson.DM_ISO8601,
+        uuid_mode=rapidjson.UM_CANONICAL,
+        number_mode=rapidjson.NM_NATIVE,
+        indent=indent,
+    )
+
+
 def as_yaml(o, content_type="text/yaml"):
     stream = StringIO()
     eodatasets3.serialise.dumps_yaml(stream, o)
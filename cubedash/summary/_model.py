@@ -2,7 +2,7 @@ import warnings
 from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime, date
-from typing import Iterable, Optional, Set, Tuple, Union, List
+from typing import Callable, Iterable, Mapping, Optional, Set, Tuple, Union, List
 
 import shapely
 import shapely.ops
@@ -27,8 +27,8 @@ class TimePeriodOverview:
     day: Optional[int]
 
     dataset_count: int
-    timeline_dataset_counts: Counter
-    region_dataset_counts: Counter
+    timeline_dataset_counts: Mapping[date, int]
+    region_dataset_counts: Mapping[str, int]
 
     timeline_period: str
 
@@ -246,15 +246,12 @@ class TimePeriodOverview:
     def _group_counter_if_needed(counter, period):
         if len(counter) > 366:
             if period == "day":
-                counter = Counter(
-                    datetime(date.year, date.month, 1).date()
-                    for date in counter.elements()
+                counter = _group_counts(
+                    counter, lambda day: date(day.year, day.month, 1)
                 )
                 period = "month"
             elif period == "month":
-                counter = Counter(
-                    datetime(date.year, 1, 1).date() for date in counter.elements()
-                )
+                counter = _group_counts(counter, lambda day: date(day.year, 1, 1))
                 period = "year"
 
         return counter, period
@@ -276,6 +273,23 @@ def _has_shape(datasets: Tuple[Dataset, Tuple[BaseGeometry, bool]]) -> bool:
     return shape is not None
 
 
+def _group_counts(counter: Counter, group_key: Callable) -> Counter:
+    """
+    Sum the counts of keys that are in the same group.
+
+    (Summing by key is much faster than expanding the counter's elements
+    one-by-one.) As with `Counter.elements()`, non-positive counts are dropped.
+
+    >>> _group_counts(Counter({1: 2, 2: 3, 3: 0, 4: 1}), lambda k: k % 2)
+    Counter({0: 4, 1: 2})
+    """
+    grouped = Counter()
+    for key, count in counter.items():
+        if count > 0:
+            grouped[group_key(key)] += count
+    return grouped
+
+
 def _erase_elements_from(items: List, start_i: int):
     """
     Erase from the given 'i' onward
@@ -1,7 +1,10 @@
 import math
 import os
 import re
+import threading
+import time
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
@@ -12,6 +15,7 @@ from typing import (
     Generator,
     Iterable,
     List,
+    Mapping,
     Optional,
     Sequence,
     Set,
@@ -22,15 +26,30 @@ from uuid import UUID
 
 import dateutil.parser
 import structlog
+from cachetools import LRUCache
 from cachetools.func import ttl_cache
 from dateutil import tz
 from geoalchemy2 import WKBElement
 from geoalchemy2 import shape as geo_shape
 from geoalchemy2.shape import to_shape
-from sqlalchemy import DDL, String, and_, func, select, exists, or_
+from shapely.geometry.base import BaseGeometry
+from sqlalchemy import (
+    DDL,
+    String,
+    and_,
+    bindparam,
+    case,
+    exists,
+    func,
+    literal,
+    or_,
+    select,
+    tuple_,
+)
 from sqlalchemy.dialects import postgresql as postgres
 from sqlalchemy.dialects.postgresql import TSTZRANGE
 from sqlalchemy.engine import Engine, RowProxy
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.sql import Select
 
 try:
@@ -69,6 +88,31 @@ _DEFAULT_REFRESH_OLDER_THAN = timedelta(hours=23)
 
 _LOG = structlog.get_logger()
 
+# Our most frequently-run queries are built once with bound parameters, so that
+# their compiled form can be cached and reused. (See SummaryStore._cached_engine)
+_SELECT_SUMMARY = select([TIME_OVERVIEW]).where(
+    and_(
+        TIME_OVERVIEW.c.product_ref == bindparam("product_ref"),
+        TIME_OVERVIEW.c.start_day == bindparam("start_day"),
+        TIME_OVERVIEW.c.period_type == bindparam("period_type"),
+    )
+)
+# The product columns needed to create a ProductSummary
+_PRODUCT_SUMMARY_COLUMNS = (
+    PRODUCT.c.dataset_count,
+    PRODUCT.c.time_earliest,
+    PRODUCT.c.time_latest,
+    PRODUCT.c.last_refresh.label("last_refresh_time"),
+    PRODUCT.c.last_successful_summary.label("last_successful_summary_time"),
+    PRODUCT.c.id.label("id_"),
+    PRODUCT.c.source_product_refs,
+    PRODUCT.c.derived_product_refs,
+    PRODUCT.c.fixed_metadata,
+)
+_SELECT_PRODUCT = select(_PRODUCT_SUMMARY_COLUMNS).where(
+    PRODUCT.c.name == bindparam("name")
+)
+
 
 class ItemSort(Enum):
     # The fastest, but paging is unusable.
@@ -200,8 +244,21 @@ class SummaryStore:
         self._update_listeners = []
 
         self._engine: Engine = _utils.alchemy_engine(index)
+        _check_connection_pool(self._engine)
+        # For executing our constant statements (`_SELECT_SUMMARY` etc) without
+        # recompiling them each time. They're a small fixed set, so a plain dict
+        # will never grow unbounded (and is safe to share between threads).
+        self._cached_engine: Engine = self._engine.execution_options(compiled_cache={})
         self._summariser = summariser
 
+        # Product summaries by name, with the (monotonic) time they were loaded.
+        # Writes only evict their own product, so reads of others stay cached.
+        self._product_cache: Dict[str, Tuple[float, ProductSummary]] = {}
+
+        # Decoded footprints of stored summaries. See `_read_summary()`
+        self._footprint_cache = LRUCache(maxsize=512)
+        self._footprint_cache_lock = threading.Lock()
+
     def add_change_listener(self, listener):
         self._update_listeners.append(listener)
 
@@ -251,11 +308,59 @@ class SummaryStore:
         self,
         force_dataset_extent_recompute=False,
     ):
-        for product in self.all_dataset_types():
-            self.refresh_product_extent(
-                product.name,
+        # Product scans are independent and mostly wait on the database, so we run
+        # a few at once. Each thread checks out its own connection from the pool.
+        pool = self._engine.pool
+        workers = min(8, pool.size()) if isinstance(pool, QueuePool) else 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                (
+                    product,
+                    executor.submit(
+                        self._refresh_dataset_extents,
+                        product,
+                        force_recompute=force_dataset_extent_recompute,
+                    ),
+                )
+                for product in self.all_dataset_types()
+            ]
+
+        # A failed scan mustn't stop us recording the others: their spatial rows
+        # are already committed, so their product summaries should match.
+        scanned = []
+        errors = []
+        for product, future in futures:
+            error = future.exception()
+            if error is not None:
+                _LOG.error(
+                    "product.scan.failed", product_name=product.name, error=error
+                )
+                errors.append(error)
+            else:
+                scanned.append((product, *future.result()))
+
+        # Find the time extents of every product in one query, rather than one each.
+        # (If we didn't, any product that still needs its extent will query its own)
+        time_extents = None
+        if force_dataset_extent_recompute or any(
+            change_count for _, _, change_count in scanned
+        ):
+            time_extents = self._find_product_time_extents()
+
+        for product, covers_up_to, change_count in scanned:
+            self._refresh_product_summary(
+                product,
+                covers_up_to,
+                change_count,
                 force_recompute=force_dataset_extent_recompute,
+                time_extent=(
+                    None
+                    if time_extents is None
+                    else time_extents.get(product.id, (None, None, 0))
+                ),
             )
+        if errors:
+            raise errors[0]
         self.refresh_stats()
 
     def find_most_recent_change(self, product_name: str):
@@ -416,11 +521,36 @@ class SummaryStore:
         Returns the count of changed dataset extents, and the
         updated product summary.
         """
+        product = self.index.products.get_by_name(product_name)
+        covers_up_to, change_count = self._refresh_dataset_extents(
+            product,
+            force_recompute=force_recompute,
+            only_those_newer_than=only_those_newer_than,
+        )
+        return self._refresh_product_summary(
+            product,
+            covers_up_to,
+            change_count,
+            dataset_sample_size=dataset_sample_size,
+            force_recompute=force_recompute,
+        )
+
+    def _refresh_dataset_extents(
+        self,
+        product: DatasetType,
+        force_recompute=False,
+        only_those_newer_than: datetime = None,
+    ) -> Tuple[datetime, int]:
+        """
+        Record any new or changed datasets of the product into the spatial table.
+
+        Returns the server time that the scan started, and the count of changed
+        dataset extents.
+        """
         # Server-side-timestamp of when we started scanning. We will
         # later know that any dataset newer than this timestamp may not
         # be in our summaries.
         covers_up_to = self._engine.execute(select([func.now()])).scalar()
-        product = self.index.products.get_by_name(product_name)
 
         _LOG.info("init.product", product_name=product.name)
         change_count = _extents.refresh_spatial_extents(
@@ -429,8 +559,43 @@ class SummaryStore:
             thorough=force_recompute,
             assume_after_date=only_those_newer_than,
         )
+        return covers_up_to, change_count
+
+    def _find_product_time_extents(self) -> Dict[int, Tuple[datetime, datetime, int]]:
+        """
+        Get the (earliest, latest, count) of datasets for all products at once.
+
+        Keyed by product id. Products without datasets are absent.
+        """
+        return {
+            dataset_type_ref: (earliest, latest, count)
+            for dataset_type_ref, earliest, latest, count in self._engine.execute(
+                select(
+                    (
+                        DATASET_SPATIAL.c.dataset_type_ref,
+                        func.min(DATASET_SPATIAL.c.center_time),
+                        func.max(DATASET_SPATIAL.c.center_time),
+                        func.count(),
+                    )
+                ).group_by(DATASET_SPATIAL.c.dataset_type_ref)
+            )
+        }
 
-        existing_summary = self.get_product_summary(product_name)
+    def _refresh_product_summary(
+        self,
+        product: DatasetType,
+        covers_up_to: datetime,
+        change_count: int,
+        dataset_sample_size: int = 1000,
+        force_recompute=False,
+        time_extent: Tuple[datetime, datetime, int] = None,
+    ) -> Tuple[int, ProductSummary]:
+        """
+        Update the stored product summary after its dataset extents were refreshed.
+
+        The (earliest, latest, count) time extent will be queried if not given.
+        """
+        existing_summary = self.get_product_summary(product.name)
         # Did nothing change at all? Just bump the refresh time.
         if change_count == 0 and (not force_recompute) and existing_summary:
             new_summary = copy(existing_summary)
@@ -439,15 +604,17 @@ class SummaryStore:
             return 0, new_summary
 
         # if change_count or force_dataset_extent_recompute:
-        earliest, latest, total_count = self._engine.execute(
-            select(
-                (
-                    func.min(DATASET_SPATIAL.c.center_time),
-                    func.max(DATASET_SPATIAL.c.center_time),
-                    func.count(),
-                )
-            ).where(DATASET_SPATIAL.c.dataset_type_ref == product.id)
-        ).fetchone()
+        if time_extent is None:
+            time_extent = self._engine.execute(
+                select(
+                    (
+                        func.min(DATASET_SPATIAL.c.center_time),
+                        func.max(DATASET_SPATIAL.c.center_time),
+                        func.count(),
+                    )
+                ).where(DATASET_SPATIAL.c.dataset_type_ref == product.id)
+            ).fetchone()
+        earliest, latest, total_count = time_extent
 
         source_products = []
         derived_products = []
@@ -713,20 +880,78 @@ class SummaryStore:
         if not product:
             return None
 
-        res = self._engine.execute(
-            select([TIME_OVERVIEW]).where(
-                and_(
-                    TIME_OVERVIEW.c.product_ref == product.id_,
-                    TIME_OVERVIEW.c.start_day == start_day,
-                    TIME_OVERVIEW.c.period_type == period,
-                )
-            )
+        res = self._cached_engine.execute(
+            _SELECT_SUMMARY,
+            product_ref=product.id_,
+            start_day=start_day,
+            period_type=period,
         ).fetchone()
 
         if not res:
             return None
 
-        return _summary_from_row(res, product_name=product_name)
+        return self._read_summary(res, product_name=product_name)
+
+    def _read_summary(self, res, product_name: str) -> TimePeriodOverview:
+        """
+        Create a summary from its stored row.
+
+        Parsing footprints is slow, so we reuse the shapes we've already decoded
+        for the same row version. (a regenerated row has a new generation_time)
+        """
+        footprint_geometry = None
+        if res["footprint_geometry"] is not None:
+            key = (
+                res["product_ref"],
+                res["start_day"],
+                res["period_type"],
+                res["generation_time"],
+            )
+            with self._footprint_cache_lock:
+                footprint_geometry = self._footprint_cache.get(key)
+            if footprint_geometry is None:
+                footprint_geometry = geo_shape.to_shape(res["footprint_geometry"])
+                with self._footprint_cache_lock:
+                    self._footprint_cache[key] = footprint_geometry
+
+        return _summary_from_row(
+            res, product_name=product_name, footprint_geometry=footprint_geometry
+        )
+
+    def _get_many(
+        self, product: ProductSummary, periods: Iterable[Tuple[str, date]]
+    ) -> Dict[Tuple[str, date], TimePeriodOverview]:
+        """
+        Load many stored summaries of a product in one query.
+
+        Periods are given in their flat representation (see
+        `TimePeriodOverview.flat_period_representation()`). Any that haven't
+        been stored are missing from the result.
+
+        They're returned in chronological order, as combining them is
+        order-sensitive.
+        """
+        periods = list(periods)
+        if not periods:
+            return {}
+
+        return {
+            (res["period_type"], res["start_day"]): self._read_summary(
+                res, product_name=product.name
+            )
+            for res in self._engine.execute(
+                select([TIME_OVERVIEW])
+                .where(
+                    and_(
+                        TIME_OVERVIEW.c.product_ref == product.id_,
+                        tuple_(
+                            TIME_OVERVIEW.c.period_type, TIME_OVERVIEW.c.start_day
+                        ).in_(periods),
+                    )
+                )
+                .order_by(TIME_OVERVIEW.c.start_day)
+            )
+        }
 
     # These are cached to avoid repeated unnecessary DB queries.
     @ttl_cache(ttl=DEFAULT_TTL)
@@ -751,28 +976,23 @@ class SummaryStore:
                 return d
         raise KeyError(f"Unknown dataset type id {id_!r}")
 
-    @ttl_cache(ttl=DEFAULT_TTL)
     def _product(self, name: str) -> ProductSummary:
-        row = self._engine.execute(
-            select(
-                [
-                    PRODUCT.c.dataset_count,
-                    PRODUCT.c.time_earliest,
-                    PRODUCT.c.time_latest,
-                    PRODUCT.c.last_refresh.label("last_refresh_time"),
-                    PRODUCT.c.last_successful_summary.label(
-                        "last_successful_summary_time"
-                    ),
-                    PRODUCT.c.id.label("id_"),
-                    PRODUCT.c.source_product_refs,
-                    PRODUCT.c.derived_product_refs,
-                    PRODUCT.c.fixed_metadata,
-                ]
-            ).where(PRODUCT.c.name == name)
-        ).fetchone()
+        cached = self._product_cache.get(name)
+        if cached is not None:
+            loaded_at, product = cached
+            if time.monotonic() - loaded_at < DEFAULT_TTL:
+                return product
+
+        row = self._cached_engine.execute(_SELECT_PRODUCT, name=name).fetchone()
         if not row:
             raise ValueError(f"Unknown product {name!r} (initialised?)")
 
+        return self._cache_product_row(name, row)
+
+    def _cache_product_row(self, name: str, row: RowProxy) -> ProductSummary:
+        """
+        Create a ProductSummary from its `_PRODUCT_SUMMARY_COLUMNS`, and cache it.
+        """
         row = dict(row)
         source_products = [
             self._dataset_type_by_id(id_).name for id_ in row.pop("source_product_refs")
@@ -782,12 +1002,14 @@ class SummaryStore:
             for id_ in row.pop("derived_product_refs")
         ]
 
-        return ProductSummary(
+        product = ProductSummary(
             name=name,
             source_products=source_products,
             derived_products=derived_products,
             **row,
         )
+        self._product_cache[name] = (time.monotonic(), product)
+        return product
 
     @ttl_cache(ttl=DEFAULT_TTL)
     def product_location_samples(self, name: str) -> List[ProductLocationSample]:
@@ -872,63 +1094,111 @@ class SummaryStore:
         # is bad because there's only 32 k values in the sequence and we have run out
         # a couple of times! So, It appears that this update-else-insert must be done
         # in two transactions...
+        #
+        # We try the update first: it returns nothing if the product doesn't exist yet,
+        # so existing products (the common case) only need the one round-trip.
+        #
+        # Both return the complete stored product, so we can cache it without
+        # selecting it again.
         row = self._engine.execute(
-            select([PRODUCT.c.id, PRODUCT.c.last_refresh]).where(
-                PRODUCT.c.name == product.name
-            )
+            PRODUCT.update()
+            .returning(*_PRODUCT_SUMMARY_COLUMNS)
+            .where(PRODUCT.c.name == product.name)
+            .values(fields)
         ).fetchone()
 
-        if row:
-            # Product already exists, so update it
-            row = self._engine.execute(
-                PRODUCT.update()
-                .returning(PRODUCT.c.id, PRODUCT.c.last_refresh)
-                .where(PRODUCT.c.id == row[0])
-                .values(fields)
-            ).fetchone()
-        else:
+        if not row:
             # Product doesn't exist, so insert it
             row = self._engine.execute(
                 postgres.insert(PRODUCT)
-                .returning(PRODUCT.c.id, PRODUCT.c.last_refresh)
+                .returning(*_PRODUCT_SUMMARY_COLUMNS)
                 .values(**fields, name=product.name)
             ).fetchone()
-        self._product.cache_clear()
-        product_id, last_refresh_time = row
 
-        product.id_ = product_id
+        product.id_ = self._cache_product_row(product.name, row).id_
 
     def _put(
         self,
         summary: TimePeriodOverview,
     ):
-        log = _LOG.bind(
-            period=summary.period_tuple,
-            summary_count=summary.dataset_count,
-        )
-        log.info("product.put")
-        product = self._product(summary.product_name)
-        period, start_day = summary.as_flat_period()
+        self._put_many([summary])
 
-        row = _summary_to_row(summary)
-        ret = self._engine.execute(
-            postgres.insert(TIME_OVERVIEW)
-            .returning(TIME_OVERVIEW.c.generation_time)
-            .on_conflict_do_update(
-                index_elements=["product_ref", "start_day", "period_type"],
-                set_=row,
-                where=and_(
-                    TIME_OVERVIEW.c.product_ref == product.id_,
-                    TIME_OVERVIEW.c.start_day == start_day,
-                    TIME_OVERVIEW.c.period_type == period,
-                ),
+    def _put_many(self, summaries: Sequence[TimePeriodOverview]):
+        """
+        Store the given summaries, replacing any existing records of their periods.
+
+        They're written in a single statement.
+        """
+        if not summaries:
+            return
+
+        rows = []
+        summaries_by_key = {}
+        for summary in summaries:
+            _LOG.info(
+                "product.put",
+                period=summary.period_tuple,
+                summary_count=summary.dataset_count,
             )
-            .values(
-                product_ref=product.id_, start_day=start_day, period_type=period, **row
+            product = self._product(summary.product_name)
+            period, start_day = summary.as_flat_period()
+
+            rows.append(
+                dict(
+                    product_ref=product.id_,
+                    start_day=start_day,
+                    period_type=period,
+                    **_summary_to_row(summary),
+                )
+            )
+            summaries_by_key[(product.id_, start_day, period)] = summary
+
+        key_names = ["product_ref", "start_day", "period_type"]
+        key_columns = [TIME_OVERVIEW.c[name] for name in key_names]
+        value_names = [name for name in rows[0] if name not in key_names]
+        # Rows whose content is unchanged keep their existing values (and generation
+        # time), so their (large) arrays and footprints aren't written again. (We
+        # don't compare the timestamps of generation or product refresh: they would
+        # always differ.)
+        #
+        # Their product refresh time is still updated, otherwise
+        # find_years_needing_update() would consider an unchanged year older than
+        # its newly-written months.
+        compared_names = [
+            name
+            for name in value_names
+            if name not in ("generation_time", "product_refresh_time")
+        ]
+        insert = postgres.insert(TIME_OVERVIEW).values(rows)
+        current_content = tuple_(*(TIME_OVERVIEW.c[name] for name in compared_names))
+        new_content = tuple_(*(insert.excluded[name] for name in compared_names))
+        is_changed = current_content.is_distinct_from(new_content)
+        ret = self._engine.execute(
+            insert.returning(
+                *key_columns,
+                TIME_OVERVIEW.c.generation_time,
+            ).on_conflict_do_update(
+                index_elements=key_names,
+                set_={
+                    name: (
+                        insert.excluded[name]
+                        if name == "product_refresh_time"
+                        else case(
+                            [(is_changed, insert.excluded[name])],
+                            else_=TIME_OVERVIEW.c[name],
+                        )
+                    )
+                    for name in value_names
+                },
             )
         )
-        [gen_time] = ret.fetchone()
-        summary.summary_gen_time = gen_time
+        gen_times = {
+            (product_ref, start_day, period): gen_time
+            for product_ref, start_day, period, gen_time in ret
+        }
+
+        for key, summary in summaries_by_key.items():
+            summary.summary_gen_time = gen_times[key]
 
     def has(
         self,
@@ -1190,23 +1460,97 @@ class SummaryStore:
         product_refresh_time: datetime = None,
     ) -> TimePeriodOverview:
         """Recalculate the given period and store it in the DB"""
-        if year and month:
-            summary = self._summariser.calculate_summary(
-                product.name,
-                year_month_day=(year, month, None),
+        [summary] = self._recalculate_periods(
+            product, [(year, month)], product_refresh_time=product_refresh_time
+        )
+        return summary
+
+    def _recalculate_periods(
+        self,
+        product: ProductSummary,
+        periods: Sequence[Tuple[Optional[int], Optional[int]]],
+        product_refresh_time: datetime = None,
+    ) -> List[TimePeriodOverview]:
+        """Recalculate the given (year, month) periods and store them in one write"""
+        month_extent = self._month_extent(product)
+        summaries = [
+            self._calculate_period(
+                product,
+                year,
+                month,
                 product_refresh_time=product_refresh_time,
+                month_extent=month_extent,
             )
+            for year, month in periods
+        ]
+        self._put_many(summaries)
+
+        for summary in summaries:
+            for listener in self._update_listeners:
+                listener(
+                    product_name=product.name,
+                    year=summary.year,
+                    month=summary.month,
+                    day=None,
+                    summary=summary,
+                )
+        return summaries
+
+    def _calculate_period(
+        self,
+        product: ProductSummary,
+        year: Optional[int] = None,
+        month: Optional[int] = None,
+        product_refresh_time: datetime = None,
+        *,
+        month_extent: Optional[Tuple[Tuple[int, int], Tuple[int, int]]],
+    ) -> TimePeriodOverview:
+        """
+        Calculate the summary of the given period (without storing it)
+
+        The month extent is the product's first and last (year, month), as
+        given by `_month_extent()`. It's None for an empty product.
+        """
+        if year and month:
+            if month_extent is None or not (
+                month_extent[0] <= (year, month) <= month_extent[1]
+            ):
+                # No datasets can be in this month, so don't bother querying them.
+                summary = self._summariser.empty_summary(
+                    product.name,
+                    year_month_day=(year, month, None),
+                    product_refresh_time=product_refresh_time,
+                )
+            else:
+                summary = self._summariser.calculate_summary(
+                    product.name,
+                    year_month_day=(year, month, None),
+                    product_refresh_time=product_refresh_time,
+                )
         elif year:
             summary = TimePeriodOverview.add_periods(
-                self.get(product.name, year, month_, None) for month_ in range(1, 13)
+                self._get_many(
+                    product,
+                    (
+                        TimePeriodOverview.flat_period_representation(
+                            year, month_, None
+                        )
+                        for month_ in range(1, 13)
+                    ),
+                ).values()
             )
         # Product. Does it have data?
         elif product.dataset_count > 0:
             summary = TimePeriodOverview.add_periods(
-                self.get(product.name, year_, None, None)
-                for year_ in range(
-                    product.time_earliest.year, product.time_latest.year + 1
-                )
+                self._get_many(
+                    product,
+                    (
+                        TimePeriodOverview.flat_period_representation(year_, None, None)
+                        for year_ in range(
+                            product.time_earliest.year, product.time_latest.year + 1
+                        )
+                    ),
+                ).values()
             )
         else:
             # Empty product
@@ -1215,18 +1559,22 @@ class SummaryStore:
 
         summary.product_refresh_time = product_refresh_time
         summary.period_tuple = (product.name, year, month, None)
-
-        self._put(summary)
-        for listener in self._update_listeners:
-            listener(
-                product_name=product.name,
-                year=year,
-                month=month,
-                day=None,
-                summary=summary,
-            )
         return summary
 
+    def _month_extent(
+        self, product: ProductSummary
+    ) -> Optional[Tuple[Tuple[int, int], Tuple[int, int]]]:
+        """
+        Get the first and last (year, month) of the product's datasets.
+
+        Months are in our grouping timezone. Returns None if the product is empty.
+        """
+        if not product.dataset_count:
+            return None
+        earliest = product.time_earliest.astimezone(self.grouping_timezone)
+        latest = product.time_latest.astimezone(self.grouping_timezone)
+        return (earliest.year, earliest.month), (latest.year, latest.month)
+
     def refresh(
         self,
         product_name: str,
@@ -1293,18 +1641,21 @@ class SummaryStore:
             months_to_update = self.find_months_needing_update(product_name)
             refresh_type = GenerateResult.UPDATED
 
-        # Months
-        for change_month, new_count in months_to_update:
-            log.debug(
-                "product.month_refresh",
-                product=product_name,
-                month=change_month,
-                change_count=new_count,
-            )
-            self._recalculate_period(
+        # Months, stored a year at a time.
+        for year, year_months in groupby(
+            months_to_update, key=lambda month_count: month_count[0].year
+        ):
+            year_months = list(year_months)
+            for change_month, new_count in year_months:
+                log.debug(
+                    "product.month_refresh",
+                    product=product_name,
+                    month=change_month,
+                    change_count=new_count,
+                )
+            self._recalculate_periods(
                 new_product,
-                change_month.year,
-                change_month.month,
+                [(year, change_month.month) for change_month, _ in year_months],
                 product_refresh_time=refresh_timestamp,
             )
 
@@ -1355,7 +1706,7 @@ class SummaryStore:
                 .values(last_successful_summary=refresh_timestamp)
             )
         )
-        self._product.cache_clear()
+        self._product_cache.pop(product.name, None)
 
     @ttl_cache(ttl=DEFAULT_TTL)
     def _get_srid_name(self, srid: int):
@@ -1368,15 +1719,26 @@ class SummaryStore:
         """
         List products with summaries available.
         """
-        all_products = self.all_dataset_types()
-        existing_products = sorted(
-            (
-                product.name
-                for product in all_products
-                if self.has(product.name, None, None, None)
-            )
+        period, start_day = TimePeriodOverview.flat_period_representation(
+            None, None, None
         )
-        return existing_products
+        return [
+            name
+            for [name] in self._engine.execute(
+                select([PRODUCT.c.name])
+                # Only those still in the datacube.
+                .where(PRODUCT.c.name.in_(select([ODC_DATASET_TYPE.c.name])))
+                .where(
+                    exists(
+                        select([TIME_OVERVIEW.c.product_ref])
+                        .where(TIME_OVERVIEW.c.product_ref == PRODUCT.c.id)
+                        .where(TIME_OVERVIEW.c.period_type == period)
+                        .where(TIME_OVERVIEW.c.start_day == start_day)
+                    )
+                )
+                .order_by(PRODUCT.c.name)
+            )
+        ]
 
     def find_datasets_for_region(
         self,
@@ -1454,6 +1816,22 @@ class SummaryStore:
         )
 
 
+def _check_connection_pool(engine: Engine):
+    """
+    Warn if the engine won't reuse connections between queries.
+
+    Every store query checks out a connection from the engine's pool, so concurrent
+    web requests rely on a queued, reused pool. We share the datacube index's engine,
+    which has SQLAlchemy's default QueuePool: 5 connections plus 10 overflow per
+    process. (Size gunicorn workers and threads with that in mind.)
+    """
+    pool = engine.pool
+    if isinstance(pool, QueuePool):
+        _LOG.debug("db.pool", status=pool.status())
+    else:
+        _LOG.warning("db.pool.unqueued", pool_class=type(pool).__name__)
+
+
 def _refresh_data(please_refresh: Set[PleaseRefresh], store: SummaryStore):
     """
     Refresh product information after a schema update, plus the given kind of data.
@@ -1486,21 +1864,22 @@ def _safe_read_date(d):
     return None
 
 
-def _summary_from_row(res, product_name):
+def _summary_from_row(
+    res, product_name, footprint_geometry: Optional[BaseGeometry] = None
+):
+    # These are read-only, so we use plain dicts rather than the cost of Counters.
     timeline_dataset_counts = (
-        Counter(
-            dict(
-                zip(res["timeline_dataset_start_days"], res["timeline_dataset_counts"])
-            )
-        )
+        dict(zip(res["timeline_dataset_start_days"], res["timeline_dataset_counts"]))
         if res["timeline_dataset_start_days"]
         else None
     )
     region_dataset_counts = (
-        Counter(dict(zip(res["regions"], res["region_dataset_counts"])))
+        dict(zip(res["regions"], res["region_dataset_counts"]))
         if res["regions"]
         else None
     )
+    if footprint_geometry is None and res["footprint_geometry"] is not None:
+        footprint_geometry = geo_shape.to_shape(res["footprint_geometry"])
     period_type = res["period_type"]
     year, month, day = TimePeriodOverview.from_flat_period_representation(
         period_type, res["start_day"]
@@ -1512,7 +1891,6 @@ def _summary_from_row(res, product_name):
         month=month,
         day=day,
         dataset_count=res["dataset_count"],
-        # : Counter
         timeline_dataset_counts=timeline_dataset_counts,
         region_dataset_counts=region_dataset_counts,
         timeline_period=res["timeline_period"],
@@ -1521,11 +1899,7 @@ def _summary_from_row(res, product_name):
         if res["time_earliest"]
         else None,
         # shapely.geometry.base.BaseGeometry
-        footprint_geometry=(
-            None
-            if res["footprint_geometry"] is None
-            else geo_shape.to_shape(res["footprint_geometry"])
-        ),
+        footprint_geometry=footprint_geometry,
         footprint_crs=(
             None
             if res["footprint_geometry"] is None or res["footprint_geometry"].srid == -1
@@ -1556,8 +1930,9 @@ def _summary_to_row(summary: TimePeriodOverview) -> dict:
         dataset_count=summary.dataset_count,
         timeline_dataset_start_days=day_values,
         timeline_dataset_counts=day_counts,
-        # TODO: SQLAlchemy needs a bit of type help for some reason. Possible PgGridCell bug?
-        regions=func.cast(region_values, type_=postgres.ARRAY(String)),
+        # SQLAlchemy needs a bit of type help for some reason. We give it on the bound
+        # parameter itself, rather than with a cast, so postgres doesn't have to do one.
+        regions=literal(region_values, type_=postgres.ARRAY(String)),
         region_dataset_counts=region_counts,
         timeline_period=summary.timeline_period,
         time_earliest=begin,
@@ -1574,11 +1949,12 @@ def _summary_to_row(summary: TimePeriodOverview) -> dict:
         footprint_count=summary.footprint_count,
         generation_time=func.now(),
         newest_dataset_creation_time=summary.newest_dataset_creation_time,
-        crses=summary.crses,
+        # Sorted, so that the stored array doesn't vary with set (hash) ordering.
+        crses=None if summary.crses is None else sorted(summary.crses),
     )
 
 
-def _counter_key_vals(counts: Counter, null_sort_key="ø") -> Tuple[Tuple, Tuple]:
+def _counter_key_vals(counts: Mapping) -> Tuple[Tuple, Tuple]:
     """
     Split counter into a keys sequence and a values sequence.
 
@@ -1593,13 +1969,15 @@ def _counter_key_vals(counts: Counter, null_sort_key="ø") -> Tuple[Tuple, Tuple
     >>> # Important! zip(*) doesn't do this.
     >>> tuple(_counter_key_vals(Counter()))
     ((), ())
+    >>> tuple(_counter_key_vals(Counter(['b', None, 'a', 'b'])))
+    (('a', 'b', None), (1, 2, 1))
     """
-    items = sorted(
-        counts.items(),
-        # Swap nulls if needed.
-        key=lambda t: (null_sort_key, t[1]) if t[0] is None else t,
-    )
-    return tuple(k for k, v in items), tuple(v for k, v in items)
+    # Sort the plain keys (much cheaper than sorting items with a key function),
+    # with any null placed last.
+    keys = sorted(k for k in counts if k is not None)
+    if None in counts:
+        keys.append(None)
+    return tuple(keys), tuple(counts[k] for k in keys)
 
 
 def _datasets_to_feature(datasets: Iterable[Dataset]):
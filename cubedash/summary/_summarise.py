@@ -115,37 +115,41 @@ class Summariser:
             row["size_bytes"] = int(row["size_bytes"])
 
         has_data = row["dataset_count"] > 0
+        year, month, day = year_month_day
 
         log.debug("counter.calc")
 
         # Initialise all requested days as zero
-        day_counts = Counter(
-            {d.date(): 0 for d in pd.date_range(begin_time, end_time, closed="left")}
-        )
+        day_counts = _zero_day_counts(begin_time, end_time)
         region_counts = Counter()
         if has_data:
-            day_counts.update(
-                Counter(
-                    {
-                        day.date(): count
-                        for day, count in self._engine.execute(
-                            select(
-                                [
-                                    func.date_trunc(
-                                        "day",
-                                        DATASET_SPATIAL.c.center_time.op(
-                                            "AT TIME ZONE"
-                                        )(self.grouping_time_zone),
-                                    ).label("day"),
-                                    func.count(),
-                                ]
+            if day:
+                # A single day's datasets all fall within that day, so we
+                # don't need another query to group them.
+                day_counts[begin_time.date()] = row["dataset_count"]
+            else:
+                day_counts.update(
+                    Counter(
+                        {
+                            day.date(): count
+                            for day, count in self._engine.execute(
+                                select(
+                                    [
+                                        func.date_trunc(
+                                            "day",
+                                            DATASET_SPATIAL.c.center_time.op(
+                                                "AT TIME ZONE"
+                                            )(self.grouping_time_zone),
+                                        ).label("day"),
+                                        func.count(),
+                                    ]
+                                )
+                                .where(where_clause)
+                                .group_by("day")
                             )
-                            .where(where_clause)
-                            .group_by("day")
-                        )
-                    }
+                        }
+                    )
                 )
-            )
             region_counts = Counter(
                 {
                     item: count
@@ -168,7 +172,6 @@ class Summariser:
                 "not have a null product refresh time."
             )
 
-        year, month, day = year_month_day
         summary = TimePeriodOverview(
             **row,
             product_name=product_name,
@@ -191,6 +194,40 @@ class Summariser:
         )
         return summary
 
+    def empty_summary(
+        self,
+        product_name: str,
+        year_month_day: Tuple[Optional[int], Optional[int], Optional[int]],
+        product_refresh_time: datetime,
+    ) -> TimePeriodOverview:
+        """
+        Create a summary of a time range that's known to have no datasets.
+
+        (It's what calculate_summary() would return, but without querying)
+        """
+        time = _utils.as_time_range(*year_month_day)
+        begin_time = self._with_default_tz(time.begin)
+        end_time = self._with_default_tz(time.end)
+        year, month, day = year_month_day
+        return TimePeriodOverview(
+            product_name=product_name,
+            year=year,
+            month=month,
+            day=day,
+            dataset_count=0,
+            timeline_dataset_counts=_zero_day_counts(begin_time, end_time),
+            region_dataset_counts=Counter(),
+            timeline_period="day",
+            time_range=Range(begin_time, end_time),
+            footprint_geometry=None,
+            footprint_crs=None,
+            footprint_count=0,
+            newest_dataset_creation_time=None,
+            crses=None,
+            size_bytes=None,
+            product_refresh_time=product_refresh_time,
+        )
+
     def _with_default_tz(self, d: datetime) -> datetime:
         if d.tzinfo is None:
             return d.replace(tzinfo=self._grouping_time_zone_tz)
@@ -236,3 +273,10 @@ class Summariser:
         Convert an internal postgres srid key to a string auth code: eg: 'EPSG:1234'
         """
         return get_srid_name(self._engine, srid)
+
+
+def _zero_day_counts(begin_time: datetime, end_time: datetime) -> Counter:
+    """A zero count for every day in the time range"""
+    return Counter(
+        {d.date(): 0 for d in pd.date_range(begin_time, end_time, closed="left")}
+    )
@@ -441,6 +441,25 @@ def test_api_returns_tiles_as_geojson(client: FlaskClient):
     assert len(geojson["features"]) == 4, "Unepected albers polygon count"
 
 
+def test_api_streams_valid_geojson(client: FlaskClient):
+    """
+    Dataset features are streamed as they're read, which should still give valid GeoJSON.
+    """
+    geojson = get_geojson(client, "/api/datasets/ls7_nbart_albers")
+    assert len(geojson["features"]) == 4
+
+    # Indented output for browsers
+    response: Response = client.get(
+        "/api/datasets/ls7_nbart_albers", headers={"Accept": "text/html"}
+    )
+    assert response.status_code == 200
+    assert json.loads(response.data) == geojson
+
+    # No features
+    geojson = get_geojson(client, "/api/datasets/ls7_nbart_albers/1990")
+    assert geojson == {"type": "FeatureCollection", "features": []}
+
+
 def test_api_returns_high_tide_comp_regions(client: FlaskClient):
     """
     High tide doesn't have anything we can use as regions.
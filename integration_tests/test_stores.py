@@ -259,3 +259,112 @@ def test_generate_raises_error(run_generate):
         f"Command should return an error when unknown products are specified. "
         f"Output: {result.output}"
     )
+
+
+def test_list_complete_products(summary_store: SummaryStore):
+    """
+    Products are complete if they have a whole-product summary and are in the datacube.
+    """
+    for product_name in ("ga_ls8c_level1_3", "ls8_nbar_scene", "some_product"):
+        summary_store._persist_product_extent(
+            ProductSummary(product_name, 0, None, None, [], [], {}, datetime.now())
+        )
+    summary_store._put(_overview("ga_ls8c_level1_3"))
+    # Only a year summary.
+    summary_store._put(_overview("ls8_nbar_scene", 2017))
+    # Not in the datacube.
+    summary_store._put(_overview("some_product"))
+
+    # The same as checking every datacube product individually.
+    expected = sorted(
+        product.name
+        for product in summary_store.all_dataset_types()
+        if summary_store.has(product.name, None, None, None)
+    )
+    assert expected == ["ga_ls8c_level1_3"]
+    assert summary_store.list_complete_products() == expected
+
+
+def test_put_many_summaries(summary_store: SummaryStore):
+    """
+    Summaries stored together should each get their own server generation time.
+    """
+    product_name = "some_product"
+    summary_store._persist_product_extent(
+        ProductSummary(
+            product_name,
+            4321,
+            datetime(2017, 1, 1),
+            datetime(2017, 4, 1),
+            [],
+            [],
+            {},
+            datetime.now(),
+        )
+    )
+    months = [_overview(product_name, 2017, month) for month in (1, 2, 3)]
+    summary_store._put_many(months)
+
+    original_gen_times = [o.summary_gen_time for o in months]
+    assert None not in original_gen_times, "Generation time should be set by server"
+    for o in months:
+        loaded = summary_store.get(product_name, 2017, o.month, None)
+        assert loaded.dataset_count == 4
+        assert loaded.summary_gen_time == o.summary_gen_time
+
+    # Change only one of them.
+    time.sleep(1)
+    months[1].dataset_count = 4321
+    summary_store._put_many(months)
+
+    assert months[0].summary_gen_time == original_gen_times[0]
+    assert months[2].summary_gen_time == original_gen_times[2]
+    assert (
+        months[1].summary_gen_time != original_gen_times[1]
+    ), "An update should update the generation time"
+
+    for o in months:
+        loaded = summary_store.get(product_name, 2017, o.month, None)
+        assert loaded.dataset_count == o.dataset_count
+        assert loaded.summary_gen_time == o.summary_gen_time
+
+
+def test_put_unchanged_year_is_not_outdated(summary_store: SummaryStore):
+    """
+    A year whose recalculated summary hasn't changed should still be marked
+    as current, not as older than its newly-written months.
+    """
+    product_name = "some_product"
+    summary_store._persist_product_extent(
+        ProductSummary(
+            product_name,
+            4321,
+            datetime(2017, 1, 1),
+            datetime(2017, 4, 1),
+            [],
+            [],
+            {},
+            datetime.now(),
+        )
+    )
+    month = _overview(product_name, 2017, 1)
+    year = _overview(product_name, 2017)
+    summary_store._put_many([month, year])
+    assert summary_store.find_years_needing_update(product_name) == []
+
+    # A new product refresh changes the month...
+    new_refresh_time = datetime(2018, 3, 3, 1, 1, 1, tzinfo=tz.tzutc())
+    month.dataset_count = 4321
+    month.product_refresh_time = new_refresh_time
+    summary_store._put(month)
+    assert summary_store.find_years_needing_update(product_name) == [2017]
+
+    # ... but the year is recalculated identically.
+    original_gen_time = year.summary_gen_time
+    year.product_refresh_time = new_refresh_time
+    summary_store._put(year)
+    assert year.summary_gen_time == original_gen_time
+    assert summary_store.find_years_needing_update(product_name) == []
+
+    loaded = summary_store.get(product_name, 2017, None, None)
+    assert loaded.product_refresh_time == new_refresh_time
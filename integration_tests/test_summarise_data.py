@@ -344,6 +344,33 @@ def test_generate_empty_time(run_generate, summary_store: SummaryStore):
     assert summary is None
 
 
+def test_empty_month_matches_calculated(summary_store: SummaryStore):
+    """
+    Months outside the product's time range aren't queried, but should be
+    summarised the same as if they were.
+    """
+    summary_store.refresh_all_product_extents()
+    product = summary_store.get_product_summary("ls8_nbar_scene")
+    refresh_time = product.last_refresh_time
+
+    skipped = summary_store._calculate_period(
+        product,
+        2015,
+        3,
+        product_refresh_time=refresh_time,
+        month_extent=summary_store._month_extent(product),
+    )
+    calculated = summary_store._summariser.calculate_summary(
+        "ls8_nbar_scene", (2015, 3, None), product_refresh_time=refresh_time
+    )
+    # (only the server sets this)
+    calculated.summary_gen_time = None
+
+    assert skipped == calculated
+    assert sum(skipped.timeline_dataset_counts.values()) == 0
+    assert len(skipped.timeline_dataset_counts) == 31
+
+
 def test_calc_empty(summary_store: SummaryStore):
     summary_store.refresh_all_product_extents()
 
@@ -352,6 +379,54 @@ def test_calc_empty(summary_store: SummaryStore):
     assert summary is None
 
 
+def test_refresh_unchanged_product_without_summary(
+    summary_store: SummaryStore, monkeypatch
+):
+    """
+    A product whose datasets were already scanned, but whose summary was never
+    stored (eg. an interrupted refresh), should still get its real extent.
+    """
+    scanned = {
+        product.name: summary_store._refresh_dataset_extents(product)
+        for product in summary_store.all_dataset_types()
+    }
+    assert summary_store.get_product_summary("ls8_nbar_scene") is None
+
+    # Nothing changes in the next scan.
+    monkeypatch.setattr(
+        summary_store,
+        "_refresh_dataset_extents",
+        lambda product, **kwargs: (scanned[product.name][0], 0),
+    )
+    summary_store.refresh_all_product_extents()
+
+    product_summary = summary_store.get_product_summary("ls8_nbar_scene")
+    assert product_summary.dataset_count == 3036
+    assert product_summary.time_earliest is not None
+    assert product_summary.time_latest is not None
+
+
+def test_refresh_all_records_products_despite_failed_scan(
+    summary_store: SummaryStore, monkeypatch
+):
+    """
+    If one product fails to scan, the others should still have their summaries stored.
+    """
+    original_scan = summary_store._refresh_dataset_extents
+
+    def scan_or_fail(product, **kwargs):
+        if product.name == "ls8_nbar_albers":
+            raise RuntimeError("Failed scan")
+        return original_scan(product, **kwargs)
+
+    monkeypatch.setattr(summary_store, "_refresh_dataset_extents", scan_or_fail)
+    with pytest.raises(RuntimeError, match="Failed scan"):
+        summary_store.refresh_all_product_extents()
+
+    assert summary_store.get_product_summary("ls8_nbar_albers") is None
+    assert summary_store.get_product_summary("ls8_nbar_scene").dataset_count == 3036
+
+
 def test_generate_telemetry(run_generate, summary_store: SummaryStore):
     """
     Telemetry data polygons can be synthesized from the path/row values